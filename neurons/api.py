@@ -16,13 +16,15 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import json
+import math
 import time
 import torch
+import orjson
 import base64
 import typing
 import asyncio
 from redis import asyncio as aioredis
+from redis.utils import HIREDIS_AVAILABLE
 import traceback
 import bittensor as bt
 import threading
@@ -32,7 +34,12 @@ from storage.shared.ecc import hash_data
 from storage.shared.checks import check_environment
 from storage.shared.utils import get_redis_password
 from storage.shared.subtensor import get_current_block
-from storage.validator.config import config, check_config, add_args
+from storage.validator.config import (
+    config,
+    check_config,
+    add_args,
+    remove_log_sinks,
+)
 from storage.validator.state import should_checkpoint
 from storage.validator.encryption import encrypt_data, setup_encryption_wallet
 from storage.validator.store import store_broadband
@@ -41,6 +48,13 @@ from storage.validator.database import retrieve_encryption_payload
 from storage.validator.cid import generate_cid_string
 from storage.validator.encryption import decrypt_data_with_private_key
 
+try:
+    import uvloop  # Optional, faster drop-in event loop.
+
+    uvloop.install()
+except ImportError:
+    pass
+
 
 def MockDendrite():
     pass
@@ -79,8 +93,14 @@ class neuron:
         bt.logging(config=self.config, logging_dir=self.config.neuron.full_path)
         print(self.config)
 
+        # Init the event loop, shared by the environment check and later work.
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
         try:
-            asyncio.run(check_environment(self.config.database.redis_conf_path))
+            self.loop.run_until_complete(
+                check_environment(self.config.database.redis_conf_path)
+            )
         except AssertionError as e:
             bt.logging.warning(
                 f"Something is missing in your environment: {e}. Please check your configuration, use the README for help, and try again."
@@ -124,6 +144,10 @@ class neuron:
             password=self.config.encryption.password,
         )
         self.encryption_wallet.coldkey  # Unlock the coldkey.
+        # Decryption key material, derived once instead of on every retrieve.
+        self._coldkey_priv_bytes = (
+            self.encryption_wallet.coldkey.private_key.hex().encode("utf-8")
+        )
         bt.logging.info(f"loading encryption wallet {self.encryption_wallet}")
 
         # Init metagraph.
@@ -134,27 +158,39 @@ class neuron:
         self.metagraph.sync(subtensor=self.subtensor)  # Sync metagraph with subtensor.
         bt.logging.debug(str(self.metagraph))
 
+        # Lookup tables for the per-request blacklist/priority checks.
+        self._hotkey_to_uid: typing.Dict[str, int] = {}
+        self._top_stake_hotkeys: typing.FrozenSet[str] = frozenset()
+        self.set_whitelisted_hotkeys(self.config.api.whitelisted_hotkeys)
+        self._refresh_metagraph_caches()
+
         # Setup database
         bt.logging.info("loading database")
         redis_password = get_redis_password(self.config.database.redis_password)
-        self.database = aioredis.StrictRedis(
+        self.database_pool = aioredis.BlockingConnectionPool(
             host=self.config.database.host,
             port=self.config.database.port,
             db=self.config.database.index,
             socket_keepalive=True,
             socket_connect_timeout=300,
             password=redis_password,
+            max_connections=self.config.database.pool_size,
         )
-        self.db_semaphore = asyncio.Semaphore()
+        # Every redis call made through self.database, including those in
+        # store_broadband/retrieve_broadband, checks a connection out of this pool, so
+        # at most pool_size commands are in flight and further callers wait for one.
+        self.database = aioredis.StrictRedis(connection_pool=self.database_pool)
+        if not HIREDIS_AVAILABLE:
+            bt.logging.warning(
+                "hiredis is not installed, falling back to the slower pure python redis parser."
+            )
 
         # Init Weights.
         bt.logging.debug("loading moving_averaged_scores")
-        self.moving_averaged_scores = torch.zeros((self.metagraph.n)).to(self.device)
+        self.moving_averaged_scores = self._alloc_scores(self.metagraph.n)
         bt.logging.debug(str(self.moving_averaged_scores))
 
-        self.my_subnet_uid = self.metagraph.hotkeys.index(
-            self.wallet.hotkey.ss58_address
-        )
+        self.my_subnet_uid = self._hotkey_to_uid[self.wallet.hotkey.ss58_address]
         bt.logging.info(f"Running validator on uid: {self.my_subnet_uid}")
 
         bt.logging.debug("serving ip to chain...")
@@ -194,9 +230,6 @@ class neuron:
             self.dendrite = bt.dendrite(wallet=self.wallet)
         bt.logging.debug(str(self.dendrite))
 
-        # Init the event loop.
-        self.loop = asyncio.get_event_loop()
-
         self.prev_step_block = get_current_block(self.subtensor)
 
         # Instantiate runners
@@ -208,6 +241,52 @@ class neuron:
 
         self.step = 0
 
+    def _alloc_scores(self, n: int) -> torch.Tensor:
+        """
+        Allocates a zeroed scores tensor of size n directly on the neuron's device,
+        avoiding a CPU allocation followed by a host-to-device copy.
+        """
+        return torch.zeros(n, device=self.device)
+
+    def debug_logging_enabled(self) -> bool:
+        """
+        Whether any log handler accepts debug records, to skip building costly messages.
+        bittensor's debug/trace flags only filter stdout; the DEBUG.log and TRACE.log
+        sinks added by check_config take every record unless events saving is off.
+        """
+        return (
+            bt.logging.__debug_on__
+            or bt.logging.__trace_on__
+            or not self.config.neuron.dont_save_events
+        )
+
+    def set_whitelisted_hotkeys(self, hotkeys: typing.Optional[typing.Iterable[str]]):
+        """
+        Replaces the explicit hotkey whitelist. The set is swapped in a single assignment,
+        so in-flight blacklist checks see either the old or the new whitelist.
+        """
+        self._whitelist_set: typing.FrozenSet[str] = frozenset(hotkeys or ())
+
+    def _refresh_metagraph_caches(self):
+        """
+        Rebuilds the hotkey -> uid lookup and the top stake hotkeys from the current
+        metagraph. Must be called after every metagraph sync so the blacklist/priority
+        functions stay O(1).
+        """
+        self._hotkey_to_uid = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
+
+        top_stake_percent = self.config.api.top_stake_percent
+        if top_stake_percent > 0:
+            n_top = math.ceil(len(self.metagraph.hotkeys) * top_stake_percent / 100)
+            top_uids = self.metagraph.S.argsort(descending=True)[:n_top].tolist()
+            self._top_stake_hotkeys = frozenset(
+                self.metagraph.hotkeys[uid] for uid in top_uids
+            )
+        else:
+            self._top_stake_hotkeys = frozenset()
+
     async def store_user_data(self, synapse: protocol.StoreUser) -> protocol.StoreUser:
         """
         Asynchronously handles the storage of user data by processing a store user request. It stores the
@@ -226,23 +305,23 @@ class neuron:
             - It relies on the 'store_broadband' method for actual storage and hash generation.
             - The method logs detailed information about the storage process for monitoring and debugging.
         """
-        bt.logging.debug(f"store_user_data() {synapse.axon.dict()}")
+        if self.debug_logging_enabled():
+            bt.logging.debug(f"store_user_data() {synapse.axon.dict()}")
 
-        decoded_data = base64.b64decode(synapse.encrypted_data)
-        decoded_data = (
-            decoded_data.encode("utf-8")
-            if isinstance(decoded_data, str)
-            else decoded_data
-        )
-        validator_encrypted_data, validator_encryption_payload = encrypt_data(
-            decoded_data, self.encryption_wallet
-        )
+        # Decoding, encryption and hashing are CPU-bound over the whole payload,
+        # run them off the event loop so other axon requests are not stalled.
+        decoded_data = await asyncio.to_thread(base64.b64decode, synapse.encrypted_data)
+        (
+            validator_encrypted_data,
+            validator_encryption_payload,
+        ) = await asyncio.to_thread(encrypt_data, decoded_data, self.encryption_wallet)
 
         # Hash the original data to avoid data confusion
-        content_id = generate_cid_string(decoded_data)
+        content_id = await asyncio.to_thread(generate_cid_string, decoded_data)
 
-        if isinstance(validator_encryption_payload, dict):
-            validator_encryption_payload = json.dumps(validator_encryption_payload)
+        # Only the validator ciphertext is needed from here on, release the plaintext
+        # copy so it is not held for the whole store_broadband network fan-out.
+        del decoded_data
 
         await self.database.set(
             f"payload:validator:{content_id}", validator_encryption_payload
@@ -265,9 +344,13 @@ class neuron:
             return False, "Open access: WARNING all whitelisted"
 
         # If explicitly whitelisted hotkey, allow.
-        if synapse.dendrite.hotkey in self.config.api.whitelisted_hotkeys:
+        if synapse.dendrite.hotkey in self._whitelist_set:
             return False, f"Hotkey {synapse.dendrite.hotkey} whitelisted."
 
+        # If in the top n% of stake, allow.
+        if synapse.dendrite.hotkey in self._top_stake_hotkeys:
+            return False, f"Hotkey {synapse.dendrite.hotkey} in top n% stake."
+
         # Otherwise, reject.
         return (
             True,
@@ -275,9 +358,9 @@ class neuron:
         )
 
     async def store_priority(self, synapse: protocol.StoreUser) -> float:
-        caller_uid = self.metagraph.hotkeys.index(
+        caller_uid = self._hotkey_to_uid[
             synapse.dendrite.hotkey
-        )  # Get the caller index.
+        ]  # Get the caller index.
         priority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
@@ -307,29 +390,39 @@ class neuron:
             verification based on the provided data hash.
             - The method logs the retrieval process and the resulting data for monitoring and debugging.
         """
-        validator_encrypted_data, user_encryption_payload = await retrieve_broadband(
-            self, synapse.data_hash
-        )
 
-        validator_encryption_payload = await retrieve_encryption_payload(
-            "validator:" + synapse.data_hash, self.database
+        # The validator payload lookup is independent of the network retrieval,
+        # so overlap it instead of paying an extra round trip afterwards. The payload
+        # comes back as the raw stored bytes and is passed straight to decryption.
+        (
+            (validator_encrypted_data, user_encryption_payload),
+            validator_encryption_payload,
+        ) = await asyncio.gather(
+            retrieve_broadband(self, synapse.data_hash),
+            retrieve_encryption_payload(
+                "validator:" + synapse.data_hash, self.database, return_dict=True
+            ),
         )
 
-        bt.logging.debug(
-            f"validator_encryption_payload: {validator_encryption_payload}"
-        )
-        decrypted_data = decrypt_data_with_private_key(
+        if self.debug_logging_enabled():
+            bt.logging.debug(
+                f"validator_encryption_payload: {validator_encryption_payload}"
+            )
+        decrypted_data = await asyncio.to_thread(
+            decrypt_data_with_private_key,
             validator_encrypted_data,
-            bytes(json.dumps(validator_encryption_payload), "utf-8"),
-            bytes(self.encryption_wallet.coldkey.private_key.hex(), "utf-8"),
+            validator_encryption_payload,
+            self._coldkey_priv_bytes,
         )
-        bt.logging.debug(f"decrypted_data: {decrypted_data[:100]}")
 
-        bt.logging.debug(f"returning user data: {decrypted_data[:100]}")
-        bt.logging.debug(f"returning user payload: {user_encryption_payload}")
-        synapse.encrypted_data = base64.b64encode(decrypted_data)
+        if self.debug_logging_enabled():
+            bt.logging.debug(f"returning user data: {decrypted_data[:100]}")
+            bt.logging.debug(f"returning user payload: {user_encryption_payload}")
+        synapse.encrypted_data = await asyncio.to_thread(
+            base64.b64encode, decrypted_data
+        )
         synapse.encryption_payload = (
-            json.dumps(user_encryption_payload)
+            orjson.dumps(user_encryption_payload).decode("utf-8")
             if isinstance(user_encryption_payload, dict)
             else user_encryption_payload
         )
@@ -343,9 +436,13 @@ class neuron:
             return False, "Open access: WARNING all whitelisted"
 
         # If explicitly whitelisted hotkey, allow.
-        if synapse.dendrite.hotkey in self.config.api.whitelisted_hotkeys:
+        if synapse.dendrite.hotkey in self._whitelist_set:
             return False, f"Hotkey {synapse.dendrite.hotkey} whitelisted."
 
+        # If in the top n% of stake, allow.
+        if synapse.dendrite.hotkey in self._top_stake_hotkeys:
+            return False, f"Hotkey {synapse.dendrite.hotkey} in top n% stake."
+
         # Otherwise, reject.
         return (
             True,
@@ -353,9 +450,9 @@ class neuron:
         )
 
     async def retrieve_priority(self, synapse: protocol.RetrieveUser) -> float:
-        caller_uid = self.metagraph.hotkeys.index(
+        caller_uid = self._hotkey_to_uid[
             synapse.dendrite.hotkey
-        )  # Get the caller index.
+        ]  # Get the caller index.
         priority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
@@ -366,7 +463,7 @@ class neuron:
 
     def run(self):
         bt.logging.info("run()")
-        if self.wallet.hotkey.ss58_address not in self.metagraph.hotkeys:
+        if self.wallet.hotkey.ss58_address not in self._hotkey_to_uid:
             raise Exception(
                 f"API is not registered - hotkey {self.wallet.hotkey.ss58_address} not in metagraph"
             )
@@ -375,22 +472,36 @@ class neuron:
                 # --- Wait until next epoch.
                 current_block = self.subtensor.get_current_block()
                 while current_block - self.prev_step_block < 3:
-                    # --- Wait for next bloc.
-                    time.sleep(1)
-                    current_block = self.subtensor.get_current_block()
+                    # --- Sleep for the expected time of the remaining blocks instead of
+                    # querying the chain every second, checking for exit meanwhile.
+                    remaining_blocks = 3 - (current_block - self.prev_step_block)
+                    wake_time = time.time() + remaining_blocks * bt.__blocktime__
+                    while not self.should_exit and time.time() < wake_time:
+                        time.sleep(1)
 
                     # --- Check if we should exit.
                     if self.should_exit:
                         break
 
-                # --- Update the metagraph with the latest network state.
-                self.prev_step_block = self.subtensor.get_current_block()
+                    current_block = self.subtensor.get_current_block()
 
-                self.metagraph = self.subtensor.metagraph(
-                    netuid=self.config.netuid,
-                    lite=True,
-                    block=self.prev_step_block,
-                )
+                # --- Update the metagraph with the latest network state.
+                self.prev_step_block = current_block
+
+                try:
+                    self.metagraph.sync(
+                        block=self.prev_step_block, lite=True, subtensor=self.subtensor
+                    )
+                except Exception as e:
+                    bt.logging.warning(
+                        f"Failed to sync metagraph in place: {e}, rebuilding it."
+                    )
+                    self.metagraph = self.subtensor.metagraph(
+                        netuid=self.config.netuid,
+                        lite=True,
+                        block=self.prev_step_block,
+                    )
+                self._refresh_metagraph_caches()
 
         # If someone intentionally stops the API, it'll safely terminate operations.
         except KeyboardInterrupt:
@@ -453,6 +564,7 @@ class neuron:
                        None if the context was exited without an exception.
         """
         self.stop_run_thread()
+        remove_log_sinks()
 
 
 def run_api():
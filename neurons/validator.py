@@ -39,7 +39,12 @@ from storage.validator.utils import (
     get_rebalance_script_path,
 )
 from storage.shared.checks import check_environment
-from storage.validator.config import config, check_config, add_args
+from storage.validator.config import (
+    config,
+    check_config,
+    add_args,
+    remove_log_sinks,
+)
 from storage.validator.state import (
     should_checkpoint,
     checkpoint,
@@ -325,6 +330,7 @@ class neuron:
                 bt.logging.debug("Closing subtensor connection")
                 self.subtensor.close()
                 self.stop_subscription_thread()
+            remove_log_sinks()
 
     def log(self, log: str):
         bt.logging.debug(log)
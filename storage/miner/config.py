@@ -23,6 +23,8 @@ import datetime
 import bittensor as bt
 from loguru import logger
 
+from storage.shared.sinks import register_events_level
+
 
 def check_config(cls, config: "bt.Config"):
     r"""Checks/validates the config namespace object."""
@@ -56,7 +58,7 @@ def check_config(cls, config: "bt.Config"):
 
     if not config.miner.dont_save_events:
         # Add custom event logger for the events.
-        logger.level("EVENTS", no=38, icon="📝")
+        register_events_level()
         logger.add(
             config.miner.log_path + "/" + "EVENTS.log",
             rotation=config.miner.events_retention_size,
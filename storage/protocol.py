@@ -42,8 +42,8 @@ class Store(bt.Synapse):
     commitment_hash: typing.Optional[str] = None  # includes seed
     ttl: typing.Optional[int] = None  # time to live (in seconds)
 
-    required_hash_fields: typing.List[str] = pydantic.Field(
-        [
+    required_hash_fields: typing.Tuple[str, ...] = pydantic.Field(
+        (
             "curve",
             "g",
             "h",
@@ -52,9 +52,9 @@ class Store(bt.Synapse):
             "commitment",
             "signature",
             "commitment_hash",
-        ],
+        ),
         title="Required Hash Fields",
-        description="A list of required fields for the hash.",
+        description="A tuple of required fields for the hash.",
         allow_mutation=False,
     )
 
@@ -74,17 +74,17 @@ class Store(bt.Synapse):
 
 
 class StoreUser(bt.Synapse):
-    # Data to store
+    # Data to store. Synapse bodies are JSON, so raw bytes must travel as base64.
     encrypted_data: str  # base64 encoded string of encrypted data (bytes)
     encryption_payload: str  # encrypted json serialized bytestring of encryption params
 
     data_hash: typing.Optional[str] = None  # Miner storage lookup key
     ttl: typing.Optional[int] = None  # time to live (in seconds)
 
-    required_hash_fields: typing.List[str] = pydantic.Field(
-        ["encrypted_data", "encryption_payload"],
+    required_hash_fields: typing.Tuple[str, ...] = pydantic.Field(
+        ("encrypted_data", "encryption_payload"),
         title="Required Hash Fields",
-        description="A list of required fields for the hash.",
+        description="A tuple of required fields for the hash.",
         allow_mutation=False,
     )
 
@@ -118,8 +118,8 @@ class Challenge(bt.Synapse):
     ] = None
     merkle_root: typing.Optional[str] = None
 
-    required_hash_fields: typing.List[str] = pydantic.Field(
-        [  # TODO: can this be done? I want to verify that these values haven't changed, but
+    required_hash_fields: typing.Tuple[str, ...] = pydantic.Field(
+        (  # TODO: can this be done? I want to verify that these values haven't changed, but
             # they are None intially...
             "commitment_hash",
             "commitment_proof",
@@ -128,9 +128,9 @@ class Challenge(bt.Synapse):
             "randomness",
             "merkle_proof",
             "merkle_root",
-        ],
+        ),
         title="Required Hash Fields",
-        description="A list of required fields for the hash.",
+        description="A tuple of required fields for the hash.",
         allow_mutation=False,
     )
 
@@ -165,10 +165,10 @@ class Retrieve(bt.Synapse):
     commitment_hash: typing.Optional[str] = None
     commitment_proof: typing.Optional[str] = None
 
-    required_hash_fields: typing.List[str] = pydantic.Field(
-        ["data", "data_hash", "seed", "commtiment_proof", "commitment_hash"],
+    required_hash_fields: typing.Tuple[str, ...] = pydantic.Field(
+        ("data", "data_hash", "seed", "commitment_proof", "commitment_hash"),
         title="Required Hash Fields",
-        description="A list of required fields for the hash.",
+        description="A tuple of required fields for the hash.",
         allow_mutation=False,
     )
 
@@ -192,9 +192,9 @@ class RetrieveUser(bt.Synapse):
     encrypted_data: typing.Optional[str] = None
     encryption_payload: typing.Optional[str] = None
 
-    required_hash_fields: typing.List[str] = pydantic.Field(
-        ["data_hash"],
+    required_hash_fields: typing.Tuple[str, ...] = pydantic.Field(
+        ("data_hash",),
         title="Required Hash Fields",
-        description="A list of required fields for the hash.",
+        description="A tuple of required fields for the hash.",
         allow_mutation=False,
     )
@@ -0,0 +1,178 @@
+# The MIT License (MIT)
+# Copyright © 2023 Yuma Rao
+# Copyright © 2023 philanthrope
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import os
+import re
+import sys
+import atexit
+import datetime
+import threading
+from loguru import logger
+from typing import Optional, Union
+
+_SIZE_PATTERN = re.compile(
+    r"^\s*(\d+(?:\.\d+)?)\s*([kmgtpezy]?)(i?)(b)\s*$", re.IGNORECASE
+)
+_SIZE_UNITS = "kmgtpezy"
+
+
+def parse_size(size: Union[str, int]) -> int:
+    """
+    Parses a human readable size such as "2 GB", "512 MiB" or "100kb" into a number of bytes.
+
+    Follows loguru's convention: "KB"/"MB"/"GB" are powers of 1000, "KiB"/"MiB"/"GiB" powers of 1024,
+    and a lowercase "b" means bits rather than bytes, so "100kb" is 12500 bytes.
+
+    Parameters:
+    - size (str | int): The size to parse. Integers are returned unchanged.
+
+    Returns:
+    - int: The size in bytes.
+
+    Raises:
+    - ValueError: If the size string cannot be parsed.
+    """
+    if isinstance(size, int):
+        return size
+
+    match = _SIZE_PATTERN.match(size)
+    if match is None:
+        raise ValueError(f"Invalid size: {size!r}")
+
+    value, unit, binary, bits = match.groups()
+    base = 1024 if binary else 1000
+    exponent = _SIZE_UNITS.index(unit.lower()) + 1 if unit else 0
+    divisor = 8 if bits == "b" else 1
+    return int(float(value) * base**exponent / divisor)
+
+
+def register_events_level():
+    """
+    Registers the custom EVENTS log level (severity 38) with loguru if it does not exist yet.
+
+    loguru raises when a level is registered twice with a severity, so every module that
+    logs EVENTS goes through this helper instead of calling logger.level() itself.
+    """
+    try:
+        logger.level("EVENTS")
+    except ValueError:
+        logger.level("EVENTS", no=38, icon="📝")
+
+
+class BatchedFileSink:
+    """
+    A loguru sink that buffers formatted records in memory and appends them to a file in batches.
+
+    Records are written with a single os.write() once the buffer reaches `max_bytes`, or every
+    `flush_interval` seconds from a daemon thread, instead of one write per record. When `rotation`
+    is set, the file is renamed with a timestamp suffix and reopened once it would grow past it.
+
+    Usage:
+        logger.add(BatchedFileSink(path, rotation="2 GB"), serialize=True, level="EVENTS")
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 65536,
+        flush_interval: float = 1.0,
+        rotation: Optional[Union[str, int]] = None,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.rotation = parse_size(rotation) if rotation is not None else None
+
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._fd = self._open()
+        self._size = os.fstat(self._fd).st_size
+
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+        atexit.register(self.stop)
+
+    def __call__(self, message: str):
+        with self._lock:
+            if self._fd is None:
+                return  # Stopped, or the file could not be reopened.
+            # backslashreplace keeps lone surrogates from raising into the logging call.
+            self._buffer += message.encode("utf-8", "backslashreplace")
+            if len(self._buffer) >= self.max_bytes:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def stop(self):
+        """Flushes any buffered records and closes the file. Safe to call more than once."""
+        self._stopped.set()
+        with self._lock:
+            if self._fd is not None:
+                self._flush()
+                os.close(self._fd)
+                self._fd = None
+        # Let a retired sink be garbage collected instead of living until exit.
+        atexit.unregister(self.stop)
+
+    def _open(self) -> int:
+        return os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+    def _flush_periodically(self):
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def _flush(self):
+        # Must be called with self._lock held. Write errors are reported and the batch
+        # dropped rather than raised, since this runs inside logging calls and on the
+        # flusher thread, neither of which should die because the disk is full.
+        if not self._buffer or self._fd is None:
+            return
+
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        written = 0
+        try:
+            if (
+                self.rotation is not None
+                and self._size > 0
+                and self._size + len(data) > self.rotation
+            ):
+                self._rotate()
+
+            while written < len(data):
+                n = os.write(self._fd, data[written:])
+                written += n
+                self._size += n
+        except OSError as e:
+            sys.stderr.write(
+                f"BatchedFileSink: dropped {len(data) - written} bytes for {self.path}: {e}\n"
+            )
+
+    def _rotate(self):
+        os.close(self._fd)
+        self._fd = None
+        try:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            os.rename(self.path, f"{self.path}.{timestamp}")
+        finally:
+            # Reopen even if the rename failed, so logging continues in the old file.
+            self._fd = self._open()
+            self._size = os.fstat(self._fd).st_size
@@ -17,356 +17,627 @@
 # DEALINGS IN THE SOFTWARE.
 
 import os
+import sys
+import copy
 import time
-import torch
 import argparse
 import datetime
+import functools
+import threading
 import bittensor as bt
 from loguru import logger
+from typing import Dict, List, Optional, Tuple
+
+from storage.shared.sinks import BatchedFileSink, parse_size, register_events_level
+
+register_events_level()
+
+
+# Shared options for the log file sinks. Records are serialized to JSON, which already
+# carries the time and level, so the text template is just the message. BatchedFileSink
+# escapes text it cannot encode and reports and drops batches it fails to write instead
+# of raising, so loguru's per-call try/except wrapper is redundant and disabled.
+_LOG_SINK_KW = dict(
+    serialize=True,
+    enqueue=False,
+    backtrace=False,
+    diagnose=False,
+    catch=False,
+    format="{message}",
+)
+
+# Config of the EVENTS log file, registered lazily on the first emitted event.
+_events_sink_config: Optional["bt.Config"] = None
+_events_sink_added = False
+_events_handler_id: Optional[int] = None
+_events_sink_lock = threading.Lock()
+
+# (fingerprint, log_path, log handler ids) of the last config seen by check_config.
+_last_check: Optional[Tuple[tuple, str, List[int]]] = None
+
+# Log file sinks added by this module, by loguru handler id.
+_log_sinks: Dict[int, BatchedFileSink] = {}
+
+
+def _add_log_sink(path: str, level: str, rotation: int) -> int:
+    sink = BatchedFileSink(path, rotation=rotation)
+    handler_id = logger.add(sink, level=level, **_LOG_SINK_KW)
+    _log_sinks[handler_id] = sink
+    return handler_id
+
+
+def _remove_log_sink(handler_id: int):
+    logger.remove(handler_id)
+    _log_sinks.pop(handler_id).stop()
+
+
+def _ensure_events_sink():
+    global _events_sink_added, _events_handler_id
+    if _events_sink_added:
+        return
+
+    with _events_sink_lock:
+        if _events_sink_added or _events_sink_config is None:
+            return
+
+        config = _events_sink_config
+        _events_handler_id = _add_log_sink(
+            os.path.join(config.neuron.log_path, "EVENTS.log"),
+            "EVENTS",
+            config.neuron.events_retention_bytes,
+        )
+        config.neuron._events_handler_id = _events_handler_id
+        _events_sink_added = True
+
+
+def _remove_events_sink():
+    global _events_sink_added, _events_handler_id
+    with _events_sink_lock:
+        if _events_handler_id is not None:
+            _remove_log_sink(_events_handler_id)
+        _events_handler_id = None
+        _events_sink_added = False
+
+
+def emit_event(message: str, **kwargs):
+    """
+    Logs a record at the EVENTS level, adding the EVENTS log file sink on first use
+    so sessions that never emit an event don't open the file.
+    """
+    _ensure_events_sink()
+    logger.log("EVENTS", message, **kwargs)
+
+
+@functools.lru_cache(maxsize=128)
+def _ensure_dir(path: str):
+    """Creates `path` if missing, at most once per path per process."""
+    os.makedirs(path, exist_ok=True)
+
+
+def _resolve_device(config: "bt.Config"):
+    """
+    Fills in --neuron.device when it was left unset. torch is only imported here, so
+    passing the device explicitly (e.g. --neuron.device cpu) never pays for the import.
+    Hosts with CUDA_VISIBLE_DEVICES="" or FORCE_CPU set skip CUDA initialization too.
+    """
+    if config.neuron.device is not None:
+        return
+
+    if os.environ.get("CUDA_VISIBLE_DEVICES") == "" or os.environ.get("FORCE_CPU"):
+        config.neuron.device = "cpu"
+        return
+
+    import torch
+
+    config.neuron.device = "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _check_fingerprint(config: "bt.Config") -> tuple:
+    return (
+        config.logging.logging_dir,
+        config.wallet.name,
+        config.wallet.hotkey,
+        config.netuid,
+        config.neuron.name,
+        config.neuron.dont_save_events,
+        config.neuron.events_retention_size,
+    )
 
 
 def check_config(cls, config: "bt.Config"):
     r"""Checks/validates the config namespace object."""
-    bt.logging.check_config(config)
+    # Repeated checks of an unchanged config reuse the previous log directory and sinks
+    # instead of re-validating logging and adding another set of log files.
+    global _last_check, _events_sink_config
+    fingerprint = _check_fingerprint(config)
+    repeat = _last_check is not None and _last_check[0] == fingerprint
+
+    if not repeat:
+        bt.logging.check_config(config)
 
     if config.mock:
         config.wallet._mock = True
 
+    _resolve_device(config)
+
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     full_path = os.path.expanduser(
-        "{}/{}/{}/netuid{}/{}".format(
+        os.path.join(
             config.logging.logging_dir,
             config.wallet.name,
             config.wallet.hotkey,
-            config.netuid,
+            f"netuid{config.netuid}",
             config.neuron.name,
         )
     )
-    log_path = os.path.join(full_path, "logs", timestamp)
+    log_path = _last_check[1] if repeat else os.path.join(full_path, "logs", timestamp)
 
-    config.neuron.full_path = os.path.expanduser(full_path)
+    config.neuron.full_path = full_path
     config.neuron.log_path = log_path
 
-    if not os.path.exists(config.neuron.full_path):
-        os.makedirs(config.neuron.full_path, exist_ok=True)
-    if not os.path.exists(config.neuron.log_path):
-        os.makedirs(config.neuron.log_path, exist_ok=True)
-
     if not config.neuron.dont_save_events:
-        # Add custom event logger for the events.
-        logger.level("EVENTS", no=38, icon="📝")
-        logger.add(
-            config.neuron.log_path + "/" + "EVENTS.log",
-            rotation=config.neuron.events_retention_size,
-            serialize=True,
-            enqueue=True,
-            backtrace=False,
-            diagnose=False,
-            level="EVENTS",
-            format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
-        )
-
-        logger.add(
-            config.neuron.log_path + "/" + "INFO.log",
-            rotation=config.neuron.events_retention_size,
-            serialize=True,
-            enqueue=True,
-            backtrace=False,
-            diagnose=False,
-            level="INFO",
-            format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
-        )
-
-        logger.add(
-            config.neuron.log_path + "/" + "DEBUG.log",
-            rotation=config.neuron.events_retention_size,
-            serialize=True,
-            enqueue=True,
-            backtrace=False,
-            diagnose=False,
-            level="DEBUG",
-            format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
-        )
-
-        logger.add(
-            config.neuron.log_path + "/" + "TRACE.log",
-            rotation=config.neuron.events_retention_size,
-            serialize=True,
-            enqueue=True,
-            backtrace=False,
-            diagnose=False,
-            level="TRACE",
-            format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
+        # Parsed once here so every sink gets a plain byte count for its rotation check.
+        config.neuron.events_retention_bytes = parse_size(
+            config.neuron.events_retention_size
         )
 
         # Set miner stats and total storage save path
-        config.neuron.miner_stats_path = os.path.expanduser(
-            os.path.join(config.neuron.full_path + "/" + "miner_stats.json")
+        config.neuron.miner_stats_path = os.path.join(
+            config.neuron.full_path, "miner_stats.json"
         )
-        config.neuron.hash_map_path = os.path.expanduser(
-            os.path.join(config.neuron.full_path + "/" + "hash_map.json")
+        config.neuron.hash_map_path = os.path.join(
+            config.neuron.full_path, "hash_map.json"
         )
-        config.neuron.total_storage_path = os.path.expanduser(
-            os.path.join(config.neuron.full_path + "/" + "total_storage.csv")
+        config.neuron.total_storage_path = os.path.join(
+            config.neuron.full_path, "total_storage.csv"
         )
 
+    # Directories and log sinks are only touched once the whole config is resolved.
+    _ensure_dir(config.neuron.full_path)
+    _ensure_dir(config.neuron.log_path)
+
+    if not repeat and _last_check is not None:
+        # The log directory changed, so retire the previous log files instead of
+        # writing every record twice, and let the EVENTS sink be re-added under the
+        # new log path on the next event.
+        for handler_id in _last_check[2]:
+            _remove_log_sink(handler_id)
+        _remove_events_sink()
+
+    handler_ids = _last_check[2] if repeat else []
+    _events_sink_config = None
+    if not config.neuron.dont_save_events:
+        # The custom event logger is only added on the first event, see emit_event.
+        _events_sink_config = config
+        config.neuron._events_handler_id = _events_handler_id
+
+        # Records are buffered and appended in batches rather than written one by one.
+        if not repeat:
+            handler_ids = [
+                _add_log_sink(
+                    os.path.join(config.neuron.log_path, f"{level}.log"),
+                    level,
+                    config.neuron.events_retention_bytes,
+                )
+                for level in ["INFO", "DEBUG", "TRACE"]
+            ]
+        config.neuron._log_handler_ids = handler_ids
+
+    _last_check = (fingerprint, log_path, handler_ids)
     bt.logging.info(f"Loaded config in fullpath: {config.neuron.full_path}")
 
 
-def add_args(cls, parser):
-    # Netuid Arg
-    parser.add_argument("--netuid", type=int, help="Storage network netuid", default=21)
+def remove_log_sinks():
+    """
+    Removes the log file sinks added by check_config and emit_event, flushing and
+    closing each file, so shutdown doesn't rely on exit hooks to write buffered records.
+    """
+    global _events_sink_added, _events_sink_config, _events_handler_id, _last_check
+    with _events_sink_lock:
+        for handler_id in list(_log_sinks):
+            _remove_log_sink(handler_id)
+        _events_sink_added = False
+        _events_sink_config = None
+        _events_handler_id = None
+        _last_check = None
 
-    parser.add_argument(
-        "--neuron.name",
-        type=str,
-        help="Trials for this miner go in miner.root / (wallet_cold - wallet_hot) / miner.name. ",
-        default="core_storage_validator",
-    )
-    parser.add_argument(
-        "--neuron.device",
-        type=str,
-        help="Device to run the validator on.",
-        default="cuda" if torch.cuda.is_available() else "cpu",
-    )
-    parser.add_argument(
-        "--neuron.curve",
-        default="P-256",
-        help="Curve for elliptic curve cryptography.",
-        choices=["P-256"],  # TODO: expand this list
-    )
-    parser.add_argument(
-        "--neuron.maxsize",
-        default=None,  # Use lognormal random gaussian if None (2**16, # 64KB)
-        type=int,
-        help="Maximum size of random data to store.",
-    )
-    parser.add_argument(
-        "--neuron.min_chunk_size",
-        default=256,
-        type=int,
-        help="Minimum chunk size of random data to challenge (bytes).",
-    )
-    parser.add_argument(
-        "--neuron.disable_log_rewards",
-        action="store_true",
-        help="Disable all reward logging, suppresses reward functions and their values from being logged to wandb.",
-        default=False,
-    )
-    parser.add_argument(
-        "--neuron.subscription_logging_path",
-        type=str,
-        help="The path to save subscription logs.",
-        default="subscription_logs.txt",
-    )
-    parser.add_argument(
-        "--neuron.chunk_factor",
-        type=int,
-        help="The chunk factor to divide data.",
-        default=4,
-    )
-    parser.add_argument(
-        "--neuron.num_concurrent_forwards",
-        type=int,
-        help="The number of concurrent forwards running at any time.",
-        default=1,
-    )
-    parser.add_argument(
-        "--neuron.disable_set_weights",
-        action="store_true",
-        help="Disables setting weights.",
-        default=False,
-    )
-    parser.add_argument(
-        "--neuron.semaphore_size",
-        type=int,
-        help="How many async calls to limit concurrently.",
-        default=256,
-    )
-    parser.add_argument(
-        "--neuron.checkpoint_block_length",
-        type=int,
-        help="Blocks before a checkpoint is saved.",
-        default=100,
-    )
-    parser.add_argument(
-        "--neuron.events_retention_size",
-        type=str,
-        help="Events retention size.",
-        default="2 GB",
-    )
-    parser.add_argument(
-        "--neuron.dont_save_events",
-        action="store_true",
-        help="If set, we dont save events to a log file.",
-        default=False,
-    )
-    parser.add_argument(
-        "--neuron.vpermit_tao_limit",
-        type=int,
-        help="The maximum number of TAO allowed to query a validator with a vpermit.",
-        default=500,
-    )
-    parser.add_argument(
-        "--neuron.verbose",
-        action="store_true",
-        help="If set, we will print verbose detailed logs.",
-        default=False,
-    )
-    parser.add_argument(
-        "--neuron.log_responses",
-        action="store_true",
-        help="If set, we will log responses. These can be LONG.",
-        default=False,
-    )
-    parser.add_argument(
-        "--neuron.data_ttl",
-        type=int,
-        help="The number of blocks before data expires (seconds).",
-        default=60 * 60 * 24 * 30,  # 30 days
-    )
-    parser.add_argument(
-        "--neuron.profile",
-        action="store_true",
-        help="If set, we will profile the neuron network and I/O actions.",
-        default=False,
-    )
-    parser.add_argument(
-        "--neuron.debug_logging_path",
-        type=str,
-        help="The path to save debug logs.",
-        default="debug_logs.txt",
-    )
 
-    # Redis arguments
-    parser.add_argument(
-        "--database.host", default="localhost", help="The host of the redis database."
-    )
-    parser.add_argument(
-        "--database.port", default=6379, help="The port of the redis database."
-    )
-    parser.add_argument(
-        "--database.index",
-        default=1,
-        help="The database number of the redis database.",
-    )
-    parser.add_argument(
-        "--database.redis_password",
-        type=str,
-        default=None,
-        help="The redis password.",
-    )
-    parser.add_argument(
-        "--database.redis_conf_path",
-        type=str,
-        help="Redis configuration path.",
-        default="/etc/redis/redis.conf",
-    )
+def _positive_int(value: str) -> int:
+    """argparse type for integer options that must be greater than zero."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} must be a positive integer")
+    return number
 
-    # Wandb args
-    parser.add_argument(
-        "--wandb.off", action="store_true", help="Turn off wandb.", default=False
-    )
-    parser.add_argument(
-        "--wandb.project_name",
-        type=str,
-        help="The name of the project where you are sending the new run.",
-        default="philanthropic-thunder",
-    )
-    parser.add_argument(
-        "--wandb.entity",
-        type=str,
-        help="An entity is a username or team name where youre sending runs.",
-        default="philanthrope",
-    )
-    parser.add_argument(
-        "--wandb.offline",
-        action="store_true",
-        help="Runs wandb in offline mode.",
-        default=False,
-    )
-    parser.add_argument(
-        "--wandb.weights_step_length",
-        type=int,
-        help="How many steps before we log the weights.",
-        default=10,
-    )
-    parser.add_argument(
-        "--wandb.run_step_length",
-        type=int,
-        help="How many steps before we rollover to a new run.",
-        default=1500,
-    )
-    parser.add_argument(
-        "--wandb.notes",
-        type=str,
-        help="Notes to add to the wandb run.",
-        default="",
-    )
 
-    # Mocks
-    parser.add_argument(
-        "--mock", action="store_true", help="Mock all items.", default=False
-    )
+# Shared kwargs for boolean --flag options, which all default to off.
+_FLAG_KW = {"action": "store_true", "default": False}
 
+# Every argument of the validator/API neurons as ((flags...), add_argument kwargs).
+_ARG_SPECS = (
+    # Netuid Arg
+    (
+        ("--netuid",),
+        {
+            "type": int,
+            "help": "Storage network netuid",
+            "default": 21,
+        },
+    ),
+    (
+        ("--neuron.name",),
+        {
+            "type": str,
+            "help": "Trials for this miner go in miner.root / (wallet_cold - wallet_hot) / miner.name. ",
+            "default": "core_storage_validator",
+        },
+    ),
+    (
+        ("--neuron.device",),
+        {
+            "type": str,
+            "help": "Device to run the validator on. Defaults to cuda if available, else cpu.",
+            "default": None,
+        },
+    ),
+    (
+        ("--neuron.curve",),
+        {
+            "default": "P-256",
+            "help": "Curve for elliptic curve cryptography.",
+            "choices": ["P-256"],  # TODO: expand this list
+        },
+    ),
+    (
+        ("--neuron.maxsize",),
+        {
+            "default": None,  # Use lognormal random gaussian if None (2**16, # 64KB)
+            "type": _positive_int,
+            "help": "Maximum size of random data to store.",
+        },
+    ),
+    (
+        ("--neuron.min_chunk_size",),
+        {
+            "default": 256,
+            "type": _positive_int,
+            "help": "Minimum chunk size of random data to challenge (bytes).",
+        },
+    ),
+    (
+        ("--neuron.disable_log_rewards",),
+        {
+            **_FLAG_KW,
+            "help": "Disable all reward logging, suppresses reward functions and their values from being logged to wandb.",
+        },
+    ),
+    (
+        ("--neuron.subscription_logging_path",),
+        {
+            "type": str,
+            "help": "The path to save subscription logs.",
+            "default": "subscription_logs.txt",
+        },
+    ),
+    (
+        ("--neuron.chunk_factor",),
+        {
+            "type": int,
+            "help": "The chunk factor to divide data.",
+            "default": 4,
+        },
+    ),
+    (
+        ("--neuron.num_concurrent_forwards",),
+        {
+            "type": int,
+            "help": "The number of concurrent forwards running at any time.",
+            "default": 1,
+        },
+    ),
+    (
+        ("--neuron.disable_set_weights",),
+        {
+            **_FLAG_KW,
+            "help": "Disables setting weights.",
+        },
+    ),
+    (
+        ("--neuron.semaphore_size",),
+        {
+            "type": int,
+            "help": "How many async calls to limit concurrently.",
+            "default": 256,
+        },
+    ),
+    (
+        ("--neuron.checkpoint_block_length",),
+        {
+            "type": int,
+            "help": "Blocks before a checkpoint is saved.",
+            "default": 100,
+        },
+    ),
+    (
+        ("--neuron.events_retention_size",),
+        {
+            "type": str,
+            "help": "Events retention size.",
+            "default": "2 GB",
+        },
+    ),
+    (
+        ("--neuron.dont_save_events",),
+        {
+            **_FLAG_KW,
+            "help": "If set, we dont save events to a log file.",
+        },
+    ),
+    (
+        ("--neuron.vpermit_tao_limit",),
+        {
+            "type": int,
+            "help": "The maximum number of TAO allowed to query a validator with a vpermit.",
+            "default": 500,
+        },
+    ),
+    (
+        ("--neuron.verbose",),
+        {
+            **_FLAG_KW,
+            "help": "If set, we will print verbose detailed logs.",
+        },
+    ),
+    (
+        ("--neuron.log_responses",),
+        {
+            **_FLAG_KW,
+            "help": "If set, we will log responses. These can be LONG.",
+        },
+    ),
+    (
+        ("--neuron.data_ttl",),
+        {
+            "type": int,
+            "help": "The number of blocks before data expires (seconds).",
+            "default": 60 * 60 * 24 * 30,  # 30 days
+        },
+    ),
+    (
+        ("--neuron.profile",),
+        {
+            **_FLAG_KW,
+            "help": "If set, we will profile the neuron network and I/O actions.",
+        },
+    ),
+    (
+        ("--neuron.debug_logging_path",),
+        {
+            "type": str,
+            "help": "The path to save debug logs.",
+            "default": "debug_logs.txt",
+        },
+    ),
+    # Redis arguments
+    (
+        ("--database.host",),
+        {
+            "default": "localhost",
+            "help": "The host of the redis database.",
+        },
+    ),
+    (
+        ("--database.port",),
+        {
+            "type": _positive_int,
+            "default": 6379,
+            "help": "The port of the redis database.",
+        },
+    ),
+    (
+        ("--database.index",),
+        {
+            "type": int,
+            "default": 1,
+            "help": "The database number of the redis database.",
+        },
+    ),
+    (
+        ("--database.pool_size",),
+        {
+            "type": int,
+            "default": 32,
+            "help": "Maximum number of concurrent redis connections.",
+        },
+    ),
+    (
+        ("--database.redis_password",),
+        {
+            "type": str,
+            "default": None,
+            "help": "The redis password.",
+        },
+    ),
+    (
+        ("--database.redis_conf_path",),
+        {
+            "type": str,
+            "help": "Redis configuration path.",
+            "default": "/etc/redis/redis.conf",
+        },
+    ),
+    # Wandb args
+    (
+        ("--wandb.off",),
+        {
+            **_FLAG_KW,
+            "help": "Turn off wandb.",
+        },
+    ),
+    (
+        ("--wandb.project_name",),
+        {
+            "type": str,
+            "help": "The name of the project where you are sending the new run.",
+            "default": "philanthropic-thunder",
+        },
+    ),
+    (
+        ("--wandb.entity",),
+        {
+            "type": str,
+            "help": "An entity is a username or team name where youre sending runs.",
+            "default": "philanthrope",
+        },
+    ),
+    (
+        ("--wandb.offline",),
+        {
+            **_FLAG_KW,
+            "help": "Runs wandb in offline mode.",
+        },
+    ),
+    (
+        ("--wandb.weights_step_length",),
+        {
+            "type": int,
+            "help": "How many steps before we log the weights.",
+            "default": 10,
+        },
+    ),
+    (
+        ("--wandb.run_step_length",),
+        {
+            "type": int,
+            "help": "How many steps before we rollover to a new run.",
+            "default": 1500,
+        },
+    ),
+    (
+        ("--wandb.notes",),
+        {
+            "type": str,
+            "help": "Notes to add to the wandb run.",
+            "default": "",
+        },
+    ),
+    # Mocks
+    (
+        ("--mock",),
+        {
+            **_FLAG_KW,
+            "help": "Mock all items.",
+        },
+    ),
     # API specific
-    parser.add_argument(
-        "--api.store_timeout",
-        type=int,
-        help="Store data query timeout.",
-        default=60,
-    )
-    parser.add_argument(
-        "--api.retrieve_timeout",
-        type=int,
-        help="Retrieve data query timeout.",
-        default=60,
-    )
-    parser.add_argument(
-        "--api.ping_timeout",
-        type=int,
-        help="Ping data query timeout.",
-        default=5,
-    )
-    parser.add_argument(
-        "--api.whitelisted_hotkeys",
-        nargs="+",
-        type=list,
-        help="List of whitelisted hotkeys.",
-        default=[],
-    )
-    parser.add_argument(
-        "--api.open_access",
-        action="store_true",
-        help="If set, we whitelist all hotkeys by default to test easily. (NOT RECOMMENDED FOR PRODUCTION)",
-    )
-
+    (
+        ("--api.store_timeout",),
+        {
+            "type": int,
+            "help": "Store data query timeout.",
+            "default": 60,
+        },
+    ),
+    (
+        ("--api.retrieve_timeout",),
+        {
+            "type": int,
+            "help": "Retrieve data query timeout.",
+            "default": 60,
+        },
+    ),
+    (
+        ("--api.ping_timeout",),
+        {
+            "type": int,
+            "help": "Ping data query timeout.",
+            "default": 5,
+        },
+    ),
+    (
+        ("--api.whitelisted_hotkeys",),
+        {
+            "nargs": "+",
+            "type": str,
+            "help": "List of whitelisted hotkeys.",
+            "default": [],
+        },
+    ),
+    (
+        ("--api.top_stake_percent",),
+        {
+            "type": float,
+            "help": "Allow hotkeys in the top n percent of stake on the subnet. 0 disables.",
+            "default": 0.0,
+        },
+    ),
+    (
+        ("--api.open_access",),
+        {
+            **_FLAG_KW,
+            "help": "If set, we whitelist all hotkeys by default to test easily. (NOT RECOMMENDED FOR PRODUCTION)",
+        },
+    ),
     # Encryption wallet
-    parser.add_argument(
-        "--encryption.wallet_name",
-        type=str,
-        help="The name of the wallet to use for encryption.",
-        default="core_storage_coldkey",
-    )
-    parser.add_argument(
-        "--encryption.wallet_hotkey",
-        type=str,
-        help="The hotkey name of the wallet to use for encryption.",
-        default="core_storage_hotkey",
-    )
-    parser.add_argument(
-        "--encryption.password",
-        type=str,
-        help="The password of the wallet to use for encryption.",
-        default="dummy_password",
-    )
+    (
+        ("--encryption.wallet_name",),
+        {
+            "type": str,
+            "help": "The name of the wallet to use for encryption.",
+            "default": "core_storage_coldkey",
+        },
+    ),
+    (
+        ("--encryption.wallet_hotkey",),
+        {
+            "type": str,
+            "help": "The hotkey name of the wallet to use for encryption.",
+            "default": "core_storage_hotkey",
+        },
+    ),
+    (
+        ("--encryption.password",),
+        {
+            "type": str,
+            "help": "The password of the wallet to use for encryption.",
+            "default": "dummy_password",
+        },
+    ),
+)
+
+
+def add_args(cls, parser):
+    for args, kwargs in _ARG_SPECS:
+        parser.add_argument(*args, **kwargs)
+
+
+# Built parsers per neuron class, and parsed configs per (class, argv).
+_PARSERS: Dict[type, argparse.ArgumentParser] = {}
+_CONFIGS: Dict[Tuple[type, Tuple[str, ...]], "bt.Config"] = {}
+
+
+def _get_parser(cls) -> argparse.ArgumentParser:
+    if cls not in _PARSERS:
+        parser = argparse.ArgumentParser()
+        bt.wallet.add_args(parser)
+        bt.subtensor.add_args(parser)
+        bt.logging.add_args(parser)
+        bt.axon.add_args(parser)
+        cls.add_args(parser)
+        _PARSERS[cls] = parser
+    return _PARSERS[cls]
+
 
+def config(cls, argv: Optional[List[str]] = None):
+    """
+    Parses the neuron config from sys.argv, caching the result per class and argv.
+    Passing `argv` parses that argument list instead and bypasses the cache.
+    """
+    if argv is not None:
+        return bt.config(_get_parser(cls), args=argv)
 
-def config(cls):
-    parser = argparse.ArgumentParser()
-    bt.wallet.add_args(parser)
-    bt.subtensor.add_args(parser)
-    bt.logging.add_args(parser)
-    bt.axon.add_args(parser)
-    cls.add_args(parser)
-    return bt.config(parser)
+    key = (cls, tuple(sys.argv))
+    if key not in _CONFIGS:
+        _CONFIGS[key] = bt.config(_get_parser(cls))
+    # Callers mutate their config (see check_config), so never hand out the cached one.
+    return copy.deepcopy(_CONFIGS[key])
@@ -18,6 +18,7 @@
 
 import json
 import time
+import orjson
 from redis import asyncio as aioredis
 import asyncio
 import bittensor as bt
@@ -646,6 +647,7 @@ async def retrieve_encryption_payload(
     Parameters:
     - full_hash (str): The full hash of the file.
     - database (aioredis.Redis): An instance of the Redis database.
+    - return_dict (bool): If True, return the payload bytes exactly as stored, skipping JSON decoding.
 
     Returns:
     - Optional[Union[bytes, dict]]: The encryption payload for the file.
@@ -655,8 +657,8 @@ async def retrieve_encryption_payload(
         if return_dict:
             return encryption_payload
         try:
-            return json.loads(encryption_payload)
-        except json.JSONDecodeError:
+            return orjson.loads(encryption_payload)
+        except orjson.JSONDecodeError:
             return encryption_payload
     else:
         return None
@@ -189,20 +189,20 @@ def decrypt_data_with_wallet(encrypted_data: bytes, wallet) -> bytes:
 
 def encrypt_data_with_aes_and_serialize(
     data: bytes, wallet: bt.wallet
-) -> typing.Tuple[bytes, bytes]:
+) -> typing.Tuple[bytes, str]:
     """
-    Decrypts the given encrypted data using a symmetric key derived from the wallet's coldkey public key.
+    Encrypts the given data with a random AES key, and encrypts that key (with its nonce and tag) using a
+    symmetric key derived from the wallet's coldkey.
 
     Args:
-        encrypted_data (bytes): Data to be decrypted.
+        data (bytes): Data to be encrypted.
         wallet (bt.wallet): Bittensor wallet object containing the coldkey.
 
     Returns:
-        bytes: Decrypted data.
+        Tuple[bytes, str]: The AES encrypted data, and the encryption payload already serialized as a JSON
+        string, ready to be stored or sent as-is.
 
-    Similar to the encryption function, this function derives a symmetric key from the wallet's coldkey public key.
-    It then uses this key to decrypt the given encrypted data. The function is primarily used for decrypting data
-    that was previously encrypted by the `encrypt_data_with_wallet` function.
+    The payload can be passed to `decrypt_data_and_deserialize` to recover the data.
     """
     # Generate a random AES key
     aes_key = os.urandom(32)  # AES key for 256-bit encryption
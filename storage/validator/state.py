@@ -21,13 +21,13 @@ import torch
 import wandb
 import copy
 
-from loguru import logger
 from dataclasses import asdict
 
 from storage import __version__ as THIS_VERSION
 from storage import __spec_version__ as THIS_SPEC_VERSION
 import storage.validator as validator
 from storage.validator.event import EventSchema
+from storage.validator.config import emit_event
 
 import bittensor as bt
 
@@ -203,7 +203,7 @@ def load_state(self):
 def log_event(self, event):
     # Log event
     if not self.config.neuron.dont_save_events:
-        logger.log("EVENTS", "events", **event.__dict__)
+        emit_event("events", **event.__dict__)
 
     # Log the event to wandb
     if not self.config.wandb.off and self.wandb is not None:
@@ -0,0 +1,79 @@
+import io
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from loguru import logger
+
+from storage.shared.sinks import BatchedFileSink, parse_size, register_events_level
+
+
+class TestSinks(TestCase):
+    def test_parse_size(self):
+        self.assertEqual(parse_size("2 GB"), 2 * 1000**3)
+        self.assertEqual(parse_size("512 MiB"), 512 * 1024**2)
+        self.assertEqual(parse_size("100KB"), 100 * 1000)
+        self.assertEqual(parse_size("100kb"), 100 * 1000 // 8)  # Lowercase b is bits.
+        self.assertEqual(parse_size("1 Kb"), 125)
+        self.assertEqual(parse_size("10 B"), 10)
+        self.assertEqual(parse_size(1234), 1234)
+        with self.assertRaises(ValueError):
+            parse_size("lots")
+
+    def test_batched_file_sink_flushes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "EVENTS.log")
+            sink = BatchedFileSink(path, max_bytes=1024, flush_interval=60)
+
+            sink("first\n")
+            sink("second\n")
+            self.assertEqual(os.path.getsize(path), 0)  # Still buffered.
+
+            with mock.patch("atexit.unregister") as unregister:
+                sink.stop()
+            unregister.assert_called_once_with(sink.stop)
+            with open(path) as f:
+                self.assertEqual(f.read(), "first\nsecond\n")
+
+    def test_batched_file_sink_escapes_unencodable_text(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "EVENTS.log")
+            sink = BatchedFileSink(path, flush_interval=60)
+
+            sink("bad \udcff name\n")  # Must not raise into the logging call.
+            sink.stop()
+            with open(path) as f:
+                self.assertEqual(f.read(), "bad \\udcff name\n")
+
+    def test_batched_file_sink_rotates(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "EVENTS.log")
+            sink = BatchedFileSink(path, max_bytes=1, flush_interval=60, rotation=10)
+
+            sink("0123456789\n")
+            sink("rotated\n")
+            sink.stop()
+
+            rotated = [name for name in os.listdir(tmp_dir) if name != "EVENTS.log"]
+            self.assertEqual(len(rotated), 1)
+            with open(path) as f:
+                self.assertEqual(f.read(), "rotated\n")
+
+    def test_batched_file_sink_reports_write_errors(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            sink = BatchedFileSink(
+                os.path.join(tmp_dir, "EVENTS.log"), max_bytes=1, flush_interval=60
+            )
+            os.close(sink._fd)  # Every write now fails with EBADF.
+
+            with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+                sink("lost\n")  # Must not raise into the logging call.
+            self.assertIn("dropped 5 bytes", stderr.getvalue())
+
+            sink._fd = None  # Already closed above.
+            sink.stop()
+
+    def test_register_events_level_is_idempotent(self):
+        register_events_level()
+        register_events_level()  # A second registration must not raise.
+        self.assertEqual(logger.level("EVENTS").no, 38)
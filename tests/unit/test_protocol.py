@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from storage import protocol
+
+
+class TestProtocol(TestCase):
+    def test_required_hash_fields_exist(self):
+        for synapse_cls in (
+            protocol.Store,
+            protocol.StoreUser,
+            protocol.Challenge,
+            protocol.Retrieve,
+            protocol.RetrieveUser,
+        ):
+            fields = synapse_cls.__fields__
+            for field in fields["required_hash_fields"].default:
+                self.assertIn(field, fields, synapse_cls.__name__)
+
+    def test_retrieve_hash_binds_commitment_proof(self):
+        synapse = protocol.Retrieve(
+            data_hash="data_hash", seed="seed", commitment_proof="proof"
+        )
+        original_hash = synapse.body_hash
+
+        synapse.commitment_proof = "tampered"
+
+        self.assertNotEqual(original_hash, synapse.body_hash)
@@ -0,0 +1,99 @@
+import os
+import sys
+import tempfile
+from unittest import TestCase, mock
+
+from loguru import logger
+
+from storage.validator import config as config_module
+from storage.validator.config import (
+    add_args,
+    check_config,
+    config,
+    emit_event,
+    remove_log_sinks,
+)
+
+
+class _Neuron:
+    @classmethod
+    def add_args(cls, parser):
+        add_args(cls, parser)
+
+
+class TestValidatorConfig(TestCase):
+    def setUp(self):
+        remove_log_sinks()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(config_module.bt.logging, "check_config")
+        self.logging_check_config = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        remove_log_sinks()
+        self.tmp_dir.cleanup()
+
+    def make_config(self, *argv):
+        return config(
+            _Neuron,
+            argv=[
+                "--logging.logging_dir",
+                self.tmp_dir.name,
+                "--neuron.device",
+                "cpu",
+                *argv,
+            ],
+        )
+
+    def test_config_returns_isolated_copies(self):
+        with mock.patch.object(sys, "argv", ["validator", "--neuron.device", "cpu"]):
+            first = config(_Neuron)
+            first.neuron.name = "mutated"
+            second = config(_Neuron)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.neuron.name, "core_storage_validator")
+
+    def test_repeat_check_reuses_log_path_and_sinks(self):
+        first = self.make_config()
+        check_config(_Neuron, first)
+        second = self.make_config()
+        check_config(_Neuron, second)
+
+        self.logging_check_config.assert_called_once()
+        self.assertEqual(second.neuron.log_path, first.neuron.log_path)
+        self.assertEqual(second.neuron._log_handler_ids, first.neuron._log_handler_ids)
+        self.assertEqual(len(config_module._log_sinks), 3)
+
+    def test_changed_config_replaces_previous_sinks(self):
+        first = self.make_config()
+        check_config(_Neuron, first)
+        emit_event("events", step=1)
+        self.assertIsNotNone(first.neuron._events_handler_id)
+
+        second = self.make_config("--neuron.name", "other_validator")
+        check_config(_Neuron, second)
+
+        self.assertEqual(self.logging_check_config.call_count, 2)
+        self.assertNotEqual(second.neuron.log_path, first.neuron.log_path)
+        self.assertEqual(
+            set(config_module._log_sinks), set(second.neuron._log_handler_ids)
+        )
+        self.assertIsNone(second.neuron._events_handler_id)
+
+        emit_event("events", step=2)
+        remove_log_sinks()
+        with open(os.path.join(second.neuron.log_path, "EVENTS.log")) as f:
+            self.assertIn('"step": 2', f.read())
+
+    def test_remove_log_sinks_flushes_and_forgets_state(self):
+        cfg = self.make_config()
+        check_config(_Neuron, cfg)
+        logger.info("flushed on shutdown")
+
+        remove_log_sinks()
+
+        self.assertEqual(config_module._log_sinks, {})
+        self.assertIsNone(config_module._last_check)
+        with open(os.path.join(cfg.neuron.log_path, "INFO.log")) as f:
+            self.assertIn("flushed on shutdown", f.read())